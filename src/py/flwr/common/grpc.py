@@ -16,7 +16,7 @@
 
 
 from logging import DEBUG
-from typing import Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 import grpc
 
@@ -30,6 +30,7 @@ def create_channel(
     insecure: bool,
     root_certificates: Optional[bytes] = None,
     max_message_length: int = GRPC_MAX_MESSAGE_LENGTH,
+    channel_options: Optional[Sequence[Tuple[str, Any]]] = None,
 ) -> grpc.Channel:
     """Create a gRPC channel, either secure or insecure."""
     # Check for conflicting parameters
@@ -42,18 +43,21 @@ def create_channel(
 
     # Possible options:
     # https://github.com/grpc/grpc/blob/v1.43.x/include/grpc/impl/codegen/grpc_types.h
-    channel_options = [
-        ("grpc.max_send_message_length", max_message_length),
-        ("grpc.max_receive_message_length", max_message_length),
-    ]
+    options: Dict[str, Any] = {
+        "grpc.max_send_message_length": max_message_length,
+        "grpc.max_receive_message_length": max_message_length,
+    }
+    # Additional options take precedence over the defaults above
+    if channel_options is not None:
+        options.update(channel_options)
 
     if insecure:
-        channel = grpc.insecure_channel(server_address, options=channel_options)
+        channel = grpc.insecure_channel(server_address, options=list(options.items()))
         log(DEBUG, "Opened insecure gRPC connection (no certificates were passed)")
     else:
         ssl_channel_credentials = grpc.ssl_channel_credentials(root_certificates)
         channel = grpc.secure_channel(
-            server_address, ssl_channel_credentials, options=channel_options
+            server_address, ssl_channel_credentials, options=list(options.items())
         )
         log(DEBUG, "Opened secure gRPC connection using certificates")
 
@@ -0,0 +1,59 @@
+# Copyright 2024 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for gRPC utility functions."""
+
+
+from unittest.mock import patch
+
+from .grpc import GRPC_MAX_MESSAGE_LENGTH, create_channel
+
+
+def test_create_channel_default_options() -> None:
+    """Test that the default max message lengths are set."""
+    # Execute
+    with patch("flwr.common.grpc.grpc.insecure_channel") as mock_insecure_channel:
+        create_channel(server_address="localhost:9091", insecure=True)
+
+    # Assert
+    _, kwargs = mock_insecure_channel.call_args
+    options = dict(kwargs["options"])
+    assert options["grpc.max_send_message_length"] == GRPC_MAX_MESSAGE_LENGTH
+    assert options["grpc.max_receive_message_length"] == GRPC_MAX_MESSAGE_LENGTH
+
+
+def test_create_channel_options_override_defaults() -> None:
+    """Test that custom channel options replace defaults instead of duplicating."""
+    # Prepare
+    channel_options = [
+        ("grpc.max_send_message_length", 1024),
+        ("grpc.keepalive_time_ms", 30_000),
+    ]
+
+    # Execute
+    with patch("flwr.common.grpc.grpc.insecure_channel") as mock_insecure_channel:
+        create_channel(
+            server_address="localhost:9091",
+            insecure=True,
+            channel_options=channel_options,
+        )
+
+    # Assert
+    _, kwargs = mock_insecure_channel.call_args
+    keys = [key for key, _ in kwargs["options"]]
+    options = dict(kwargs["options"])
+    assert keys.count("grpc.max_send_message_length") == 1
+    assert options["grpc.max_send_message_length"] == 1024
+    assert options["grpc.max_receive_message_length"] == GRPC_MAX_MESSAGE_LENGTH
+    assert options["grpc.keepalive_time_ms"] == 30_000
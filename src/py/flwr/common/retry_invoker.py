@@ -242,7 +242,8 @@ class RetryInvoker:
                 handler(cast(RetryState, ref_state[0]))
 
         try_cnt = 0
-        wait_generator = self.wait_gen_factory()
+        # Only created on the first failure to keep the success path cheap
+        wait_generator: Optional[Generator[float, None, None]] = None
         start = time.monotonic()
         ref_state: List[Optional[RetryState]] = [None]
 
@@ -278,6 +279,8 @@ class RetryInvoker:
                     try_call_event_handler(self.on_giveup)
                     raise
 
+                if wait_generator is None:
+                    wait_generator = self.wait_gen_factory()
                 try:
                     wait_time = next(wait_generator)
                     if self.jitter is not None:
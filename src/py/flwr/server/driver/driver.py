@@ -16,7 +16,7 @@
 
 import time
 import warnings
-from typing import Iterable, List, Optional, Tuple
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
 
 from flwr.common import DEFAULT_TTL, Message, Metadata, RecordSet
 from flwr.common.serde import message_from_taskres, message_to_taskins
@@ -48,15 +48,21 @@ class Driver:
             * CA certificate.
             * server certificate.
             * server private key.
+    channel_options : Optional[Sequence[Tuple[str, Any]]] (default: None)
+        Additional gRPC channel arguments, e.g., keepalive settings, passed to the
+        channel of the underlying `GrpcDriver`. They take precedence over the
+        defaults set by Flower.
     """
 
     def __init__(
         self,
         driver_service_address: str = DEFAULT_SERVER_ADDRESS_DRIVER,
         root_certificates: Optional[bytes] = None,
+        channel_options: Optional[Sequence[Tuple[str, Any]]] = None,
     ) -> None:
         self.addr = driver_service_address
         self.root_certificates = root_certificates
+        self.channel_options = channel_options
         self.grpc_driver: Optional[GrpcDriver] = None
         self.run_id: Optional[int] = None
         self.node = Node(node_id=0, anonymous=True)
@@ -68,6 +74,7 @@ class Driver:
             self.grpc_driver = GrpcDriver(
                 driver_service_address=self.addr,
                 root_certificates=self.root_certificates,
+                channel_options=self.channel_options,
             )
             self.grpc_driver.connect()
             res = self.grpc_driver.create_run(CreateRunRequest())
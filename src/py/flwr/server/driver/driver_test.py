@@ -74,6 +74,23 @@ class TestDriver(unittest.TestCase):
         self.mock_grpc_driver.connect.assert_called_once()
         self.assertEqual(self.driver.run_id, 61016)
 
+    def test_channel_options_passed_to_grpc_driver(self) -> None:
+        """Test that channel options are forwarded to GrpcDriver."""
+        # Prepare
+        channel_options = [("grpc.keepalive_time_ms", 30_000)]
+        with patch(
+            "flwr.server.driver.driver.GrpcDriver", return_value=self.mock_grpc_driver
+        ) as mock_grpc_driver_cls:
+            driver = Driver(channel_options=channel_options)
+
+            # Execute
+            # pylint: disable-next=protected-access
+            driver._get_grpc_driver_and_run_id()
+
+        # Assert
+        _, kwargs = mock_grpc_driver_cls.call_args
+        self.assertEqual(kwargs["channel_options"], channel_options)
+
     def test_get_nodes(self) -> None:
         """Test retrieval of nodes."""
         # Prepare
@@ -16,7 +16,7 @@
 
 
 from logging import DEBUG, ERROR, WARNING
-from typing import Optional
+from typing import Any, Optional, Sequence, Tuple
 
 import grpc
 
@@ -52,9 +52,11 @@ class GrpcDriver:
         self,
         driver_service_address: str = DEFAULT_SERVER_ADDRESS_DRIVER,
         root_certificates: Optional[bytes] = None,
+        channel_options: Optional[Sequence[Tuple[str, Any]]] = None,
     ) -> None:
         self.driver_service_address = driver_service_address
         self.root_certificates = root_certificates
+        self.channel_options = channel_options
         self.channel: Optional[grpc.Channel] = None
         self.stub: Optional[DriverStub] = None
 
@@ -68,6 +70,7 @@ class GrpcDriver:
             server_address=self.driver_service_address,
             insecure=(self.root_certificates is None),
             root_certificates=self.root_certificates,
+            channel_options=self.channel_options,
         )
         self.stub = DriverStub(self.channel)
         log(DEBUG, "[Driver] Connected to %s", self.driver_service_address)
@@ -127,3 +130,31 @@ class GrpcDriver:
         # Call Driver API
         res: PullTaskResResponse = self.stub.PullTaskRes(request=req)
         return res
+
+    def push_task_ins_future(self, req: PushTaskInsRequest) -> grpc.Future:
+        """Schedule tasks without blocking on the response.
+
+        Returns a `grpc.Future` whose `result()` is a `PushTaskInsResponse`. This
+        allows several requests to be in flight on the same channel at once.
+        """
+        # Check if channel is open
+        if self.stub is None:
+            log(ERROR, ERROR_MESSAGE_DRIVER_NOT_CONNECTED)
+            raise ConnectionError("`GrpcDriver` instance not connected")
+
+        # Call gRPC Driver API
+        return self.stub.PushTaskIns.future(request=req)
+
+    def pull_task_res_future(self, req: PullTaskResRequest) -> grpc.Future:
+        """Get task results without blocking on the response.
+
+        Returns a `grpc.Future` whose `result()` is a `PullTaskResResponse`. This
+        allows several requests to be in flight on the same channel at once.
+        """
+        # Check if channel is open
+        if self.stub is None:
+            log(ERROR, ERROR_MESSAGE_DRIVER_NOT_CONNECTED)
+            raise ConnectionError("`GrpcDriver` instance not connected")
+
+        # Call gRPC Driver API
+        return self.stub.PullTaskRes.future(request=req)
@@ -0,0 +1,80 @@
+# Copyright 2024 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for GrpcDriver."""
+
+
+import unittest
+from unittest.mock import Mock
+
+from flwr.proto.driver_pb2 import (  # pylint: disable=E0611
+    PullTaskResRequest,
+    PushTaskInsRequest,
+)
+
+from .grpc_driver import GrpcDriver
+
+
+class TestGrpcDriver(unittest.TestCase):
+    """Tests for `GrpcDriver` class."""
+
+    def setUp(self) -> None:
+        """Initialize GrpcDriver with a mock stub before each test."""
+        self.mock_stub = Mock()
+        self.grpc_driver = GrpcDriver()
+        self.grpc_driver.stub = self.mock_stub
+
+    def test_push_task_ins_future(self) -> None:
+        """Test that push_task_ins_future returns the future of the stub call."""
+        # Prepare
+        req = PushTaskInsRequest()
+
+        # Execute
+        future = self.grpc_driver.push_task_ins_future(req)
+
+        # Assert
+        self.mock_stub.PushTaskIns.future.assert_called_once_with(request=req)
+        self.mock_stub.PushTaskIns.assert_not_called()
+        self.assertIs(future, self.mock_stub.PushTaskIns.future.return_value)
+
+    def test_pull_task_res_future(self) -> None:
+        """Test that pull_task_res_future returns the future of the stub call."""
+        # Prepare
+        req = PullTaskResRequest(task_ids=["id1"])
+
+        # Execute
+        future = self.grpc_driver.pull_task_res_future(req)
+
+        # Assert
+        self.mock_stub.PullTaskRes.future.assert_called_once_with(request=req)
+        self.mock_stub.PullTaskRes.assert_not_called()
+        self.assertIs(future, self.mock_stub.PullTaskRes.future.return_value)
+
+    def test_push_task_ins_future_not_connected(self) -> None:
+        """Test that push_task_ins_future fails if not connected."""
+        # Prepare
+        self.grpc_driver.stub = None
+
+        # Execute & Assert
+        with self.assertRaises(ConnectionError):
+            self.grpc_driver.push_task_ins_future(PushTaskInsRequest())
+
+    def test_pull_task_res_future_not_connected(self) -> None:
+        """Test that pull_task_res_future fails if not connected."""
+        # Prepare
+        self.grpc_driver.stub = None
+
+        # Execute & Assert
+        with self.assertRaises(ConnectionError):
+            self.grpc_driver.pull_task_res_future(PullTaskResRequest())
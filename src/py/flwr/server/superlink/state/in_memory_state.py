@@ -43,6 +43,40 @@ class InMemoryState(State):
 
     def store_task_ins(self, task_ins: TaskIns) -> Optional[UUID]:
         """Store one TaskIns."""
+        # Validate task and create task_id
+        task_id = self._prepare_task_ins(task_ins)
+        if task_id is None:
+            return None
+
+        # Store TaskIns
+        with self.lock:
+            self.task_ins_store[task_id] = task_ins
+
+        # Return the new task_id
+        return task_id
+
+    def store_task_ins_batch(
+        self, task_ins_list: List[TaskIns]
+    ) -> List[Optional[UUID]]:
+        """Store multiple TaskIns."""
+        task_ids: List[Optional[UUID]] = []
+        new_task_ins: Dict[UUID, TaskIns] = {}
+        for task_ins in task_ins_list:
+            # Validate task and create task_id
+            task_id = self._prepare_task_ins(task_ins)
+            if task_id is not None:
+                new_task_ins[task_id] = task_ins
+            task_ids.append(task_id)
+
+        # Store all valid TaskIns at once
+        with self.lock:
+            self.task_ins_store.update(new_task_ins)
+
+        # Return the new task_ids
+        return task_ids
+
+    def _prepare_task_ins(self, task_ins: TaskIns) -> Optional[UUID]:
+        """Validate a TaskIns and assign it a new `task_id`."""
         # Validate task
         errors = validate_task_ins_or_res(task_ins)
         if any(errors):
@@ -55,13 +89,7 @@ class InMemoryState(State):
 
         # Create task_id
         task_id = uuid4()
-
-        # Store TaskIns
         task_ins.task_id = str(task_id)
-        with self.lock:
-            self.task_ins_store[task_id] = task_ins
-
-        # Return the new task_id
         return task_id
 
     def get_task_ins(
@@ -189,30 +189,69 @@ class SqliteState(State):
         If `task_ins.task.consumer.anonymous` is `False`, then
         `task_ins.task.consumer.node_id` MUST be set (not 0)
         """
-        # Validate task
-        errors = validate_task_ins_or_res(task_ins)
-        if any(errors):
-            log(ERROR, errors)
+        # Validate task and create task_id
+        prepared = _prepare_task_ins_row(task_ins)
+        if prepared is None:
             return None
-
-        # Create task_id
-        task_id = uuid4()
+        task_id, row = prepared
 
         # Store TaskIns
+        if not self._insert_task_ins_rows([row]):
+            return None
+
         task_ins.task_id = str(task_id)
-        data = (task_ins_to_dict(task_ins),)
-        columns = ", ".join([f":{key}" for key in data[0]])
+        return task_id
+
+    def store_task_ins_batch(
+        self, task_ins_list: List[TaskIns]
+    ) -> List[Optional[UUID]]:
+        """Store multiple TaskIns using a single `INSERT` statement.
+
+        Returns one entry per element of `task_ins_list`, in the same order: the
+        `task_id` (UUID) if the TaskIns was stored, or `None` if it was not.
+        """
+        # Validate tasks and create task_ids
+        prepared_list = [_prepare_task_ins_row(task_ins) for task_ins in task_ins_list]
+        rows: List[DictOrTuple] = [
+            prepared[1] for prepared in prepared_list if prepared is not None
+        ]
+
+        # Store all valid TaskIns in one transaction
+        if len(rows) > 0 and not self._insert_task_ins_rows(rows):
+            # The whole transaction was rolled back, so store the TaskIns one by one
+            # to only fail those with an invalid run_id
+            for index, prepared in enumerate(prepared_list):
+                if prepared is not None and not self._insert_task_ins_rows(
+                    [prepared[1]]
+                ):
+                    prepared_list[index] = None
+
+        # Only set task_id on TaskIns that were actually stored
+        task_ids: List[Optional[UUID]] = []
+        for task_ins, prepared in zip(task_ins_list, prepared_list):
+            if prepared is None:
+                task_ids.append(None)
+                continue
+            task_id, _ = prepared
+            task_ins.task_id = str(task_id)
+            task_ids.append(task_id)
+
+        return task_ids
+
+    def _insert_task_ins_rows(self, rows: List[DictOrTuple]) -> bool:
+        """Insert TaskIns rows in one transaction and return whether it succeeded."""
+        columns = ", ".join([f":{key}" for key in rows[0]])
         query = f"INSERT INTO task_ins VALUES({columns});"
 
         # Only invalid run_id can trigger IntegrityError.
         # This may need to be changed in the future version with more integrity checks.
         try:
-            self.query(query, data)
+            self.query(query, rows)
         except sqlite3.IntegrityError:
             log(ERROR, "`run` is invalid")
-            return None
+            return False
 
-        return task_id
+        return True
 
     def get_task_ins(
         self, node_id: Optional[int], limit: Optional[int]
@@ -597,6 +636,22 @@ def dict_factory(
     return dict(zip(fields, row))
 
 
+def _prepare_task_ins_row(task_ins: TaskIns) -> Optional[Tuple[UUID, Dict[str, Any]]]:
+    """Validate a TaskIns and build its row with a new `task_id`.
+
+    The TaskIns itself is left unchanged so that it can be retried if the insert fails.
+    """
+    errors = validate_task_ins_or_res(task_ins)
+    if any(errors):
+        log(ERROR, errors)
+        return None
+
+    task_id = uuid4()
+    row = task_ins_to_dict(task_ins)
+    row["task_id"] = str(task_id)
+    return task_id, row
+
+
 def task_ins_to_dict(task_msg: TaskIns) -> Dict[str, Any]:
     """Transform TaskIns to dict."""
     result = {
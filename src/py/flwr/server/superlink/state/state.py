@@ -47,6 +47,25 @@ class State(abc.ABC):
         storing the `task_ins` MUST fail.
         """
 
+    @abc.abstractmethod
+    def store_task_ins_batch(
+        self, task_ins_list: List[TaskIns]
+    ) -> List[Optional[UUID]]:
+        """Store multiple TaskIns at once.
+
+        Usually, the Driver API calls this to schedule a batch of instructions.
+
+        Behaves like calling `store_task_ins` for each element of `task_ins_list`,
+        but allows implementations to persist all TaskIns in a single operation.
+        Returns one entry per element of `task_ins_list`, in the same order: the
+        `task_id` (UUID) if the TaskIns was stored, or `None` if it was not.
+
+        Constraints
+        -----------
+        Each `task_ins` MUST satisfy the constraints of `store_task_ins`. A `task_ins`
+        which does not MUST NOT prevent the other elements from being stored.
+        """
+
     @abc.abstractmethod
     def get_task_ins(
         self, node_id: Optional[int], limit: Optional[int]
@@ -100,6 +100,77 @@ class StateTest(unittest.TestCase):
         )
         assert actual_task.ttl > 0
 
+    def test_store_task_ins_batch(self) -> None:
+        """Test store_task_ins_batch with valid and invalid TaskIns."""
+        # Prepare
+        consumer_node_id = 1
+        state = self.state_factory()
+        run_id = state.create_run()
+        task_ins_0 = create_task_ins(
+            consumer_node_id=consumer_node_id, anonymous=False, run_id=run_id
+        )
+        task_ins_1 = create_task_ins(
+            consumer_node_id=consumer_node_id, anonymous=True, run_id=run_id
+        )
+        task_ins_2 = create_task_ins(
+            consumer_node_id=consumer_node_id, anonymous=False, run_id=run_id
+        )
+
+        # Execute
+        task_ids = state.store_task_ins_batch([task_ins_0, task_ins_1, task_ins_2])
+        task_ins_list = state.get_task_ins(node_id=consumer_node_id, limit=None)
+
+        # Assert
+        assert len(task_ids) == 3
+        assert task_ids[0] is not None
+        assert task_ids[1] is None
+        assert task_ids[2] is not None
+        assert state.num_task_ins() == 2
+        assert {task_ins.task_id for task_ins in task_ins_list} == {
+            str(task_ids[0]),
+            str(task_ids[2]),
+        }
+        assert task_ins_0.task_id == str(task_ids[0])
+        assert task_ins_2.task_id == str(task_ids[2])
+
+    def test_store_task_ins_batch_with_invalid_run_id(self) -> None:
+        """Test that an invalid run_id does not prevent storing the other TaskIns."""
+        # Prepare
+        consumer_node_id = 1
+        state = self.state_factory()
+        run_id = state.create_run()
+        task_ins_0 = create_task_ins(
+            consumer_node_id=consumer_node_id, anonymous=False, run_id=run_id
+        )
+        task_ins_1 = create_task_ins(
+            consumer_node_id=consumer_node_id, anonymous=False, run_id=61016
+        )
+        task_ins_2 = create_task_ins(
+            consumer_node_id=consumer_node_id, anonymous=True, run_id=run_id
+        )
+        task_ins_3 = create_task_ins(
+            consumer_node_id=consumer_node_id, anonymous=False, run_id=run_id
+        )
+
+        # Execute
+        task_ids = state.store_task_ins_batch(
+            [task_ins_0, task_ins_1, task_ins_2, task_ins_3]
+        )
+        task_ins_list = state.get_task_ins(node_id=consumer_node_id, limit=None)
+
+        # Assert
+        assert len(task_ids) == 4
+        assert task_ids[0] is not None
+        assert task_ids[1] is None
+        assert task_ids[2] is None
+        assert task_ids[3] is not None
+        assert state.num_task_ins() == 2
+        assert {task_ins.task_id for task_ins in task_ins_list} == {
+            str(task_ids[0]),
+            str(task_ids[3]),
+        }
+        assert task_ins_1.task_id == ""
+
     def test_store_and_delete_tasks(self) -> None:
         """Test delete_tasks."""
         # Prepare
@@ -31,100 +31,71 @@ def validate_task_ins_or_res(tasks_ins_res: Union[TaskIns, TaskRes]) -> List[str
     if not tasks_ins_res.HasField("task"):
         validation_errors.append("`task` does not set field `task`")
 
+    task = tasks_ins_res.task
+
     # Created/delivered/TTL/Pushed
-    if (
-        tasks_ins_res.task.created_at < 1711497600.0
-    ):  # unix timestamp of 27 March 2024 00h:00m:00s UTC
+    if task.created_at < 1711497600.0:
+        # unix timestamp of 27 March 2024 00h:00m:00s UTC
         validation_errors.append(
             "`created_at` must be a float that records the unix timestamp "
             "in seconds when the message was created."
         )
-    if tasks_ins_res.task.delivered_at != "":
+    if task.delivered_at != "":
         validation_errors.append("`delivered_at` must be an empty str")
-    if tasks_ins_res.task.ttl <= 0:
+    if task.ttl <= 0:
         validation_errors.append("`ttl` must be higher than zero")
-    if tasks_ins_res.task.pushed_at < 1711497600.0:
+    if task.pushed_at < 1711497600.0:
         # unix timestamp of 27 March 2024 00h:00m:00s UTC
         validation_errors.append("`pushed_at` is not a recent timestamp")
 
     # TaskIns specific
     if isinstance(tasks_ins_res, TaskIns):
         # Task producer
-        if not tasks_ins_res.task.HasField("producer"):
+        if not task.HasField("producer"):
             validation_errors.append("`producer` does not set field `producer`")
-        if tasks_ins_res.task.producer.node_id != 0:
+        producer = task.producer
+        if producer.node_id != 0:
             validation_errors.append("`producer.node_id` is not 0")
-        if not tasks_ins_res.task.producer.anonymous:
+        if not producer.anonymous:
             validation_errors.append("`producer` is not anonymous")
 
-        # Task consumer
-        if not tasks_ins_res.task.HasField("consumer"):
-            validation_errors.append("`consumer` does not set field `consumer`")
-        if (
-            tasks_ins_res.task.consumer.anonymous
-            and tasks_ins_res.task.consumer.node_id != 0
-        ):
-            validation_errors.append("anonymous consumers MUST NOT set a `node_id`")
-        if (
-            not tasks_ins_res.task.consumer.anonymous
-            and tasks_ins_res.task.consumer.node_id == 0
-        ):
-            validation_errors.append("non-anonymous consumer MUST provide a `node_id`")
-
-        # Content check
-        if tasks_ins_res.task.task_type == "":
-            validation_errors.append("`task_type` MUST be set")
-        if not (
-            tasks_ins_res.task.HasField("recordset")
-            ^ tasks_ins_res.task.HasField("error")
-        ):
-            validation_errors.append("Either `recordset` or `error` MUST be set")
-
         # Ancestors
-        if len(tasks_ins_res.task.ancestry) != 0:
+        if len(task.ancestry) != 0:
             validation_errors.append("`ancestry` is not empty")
 
     # TaskRes specific
-    if isinstance(tasks_ins_res, TaskRes):
+    elif isinstance(tasks_ins_res, TaskRes):
         # Task producer
-        if not tasks_ins_res.task.HasField("producer"):
+        if not task.HasField("producer"):
             validation_errors.append("`producer` does not set field `producer`")
-        if (
-            tasks_ins_res.task.producer.anonymous
-            and tasks_ins_res.task.producer.node_id != 0
-        ):
-            validation_errors.append("anonymous producers MUST NOT set a `node_id`")
-        if (
-            not tasks_ins_res.task.producer.anonymous
-            and tasks_ins_res.task.producer.node_id == 0
-        ):
-            validation_errors.append("non-anonymous producer MUST provide a `node_id`")
-
-        # Task consumer
-        if not tasks_ins_res.task.HasField("consumer"):
-            validation_errors.append("`consumer` does not set field `consumer`")
-        if (
-            tasks_ins_res.task.consumer.anonymous
-            and tasks_ins_res.task.consumer.node_id != 0
-        ):
-            validation_errors.append("anonymous consumers MUST NOT set a `node_id`")
-        if (
-            not tasks_ins_res.task.consumer.anonymous
-            and tasks_ins_res.task.consumer.node_id == 0
-        ):
-            validation_errors.append("non-anonymous consumer MUST provide a `node_id`")
-
-        # Content check
-        if tasks_ins_res.task.task_type == "":
-            validation_errors.append("`task_type` MUST be set")
-        if not (
-            tasks_ins_res.task.HasField("recordset")
-            ^ tasks_ins_res.task.HasField("error")
-        ):
-            validation_errors.append("Either `recordset` or `error` MUST be set")
+        producer = task.producer
+        # A node must be anonymous if and only if its `node_id` is 0
+        if producer.anonymous == (producer.node_id != 0):
+            validation_errors.append(
+                "anonymous producers MUST NOT set a `node_id`"
+                if producer.anonymous
+                else "non-anonymous producer MUST provide a `node_id`"
+            )
 
         # Ancestors
-        if len(tasks_ins_res.task.ancestry) == 0:
+        if len(task.ancestry) == 0:
             validation_errors.append("`ancestry` is empty")
 
+    # Task consumer
+    if not task.HasField("consumer"):
+        validation_errors.append("`consumer` does not set field `consumer`")
+    consumer = task.consumer
+    if consumer.anonymous == (consumer.node_id != 0):
+        validation_errors.append(
+            "anonymous consumers MUST NOT set a `node_id`"
+            if consumer.anonymous
+            else "non-anonymous consumer MUST provide a `node_id`"
+        )
+
+    # Content check
+    if task.task_type == "":
+        validation_errors.append("`task_type` MUST be set")
+    if task.HasField("recordset") == task.HasField("error"):
+        validation_errors.append("Either `recordset` or `error` MUST be set")
+
     return validation_errors